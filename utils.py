@@ -1,54 +1,191 @@
+from bisect import bisect_left
+from functools import wraps
+
 import numpy as np
 import pandas as pd
-from typing import Any, Set, List
-import matplotlib.pyplot as plt
-import seaborn as sns
+from typing import Optional, Union
+
+try:
+    import numba
+except ImportError:  # numba est optionnel : repli sur du Python pur
+    numba = None
+
+
+def _njit(func=None, **options):
+    """Compile `func` with numba.njit (extra `options` passed through) when numba is installed."""
+    if func is None:
+        return lambda f: _njit(f, **options)
+    if numba is None:
+        return func
+    return numba.njit(cache=True, **options)(func)
 
+_prange = range if numba is None else numba.prange
 
-def nan_rate_by_columns(df: pd.DataFrame) -> pd.Series:
+def _vectorize(func):
+    """
+    Turn a scalar scoring function into a NumPy ufunc returning integers.
+    With numba, the ufunc is compiled on its first call rather than at import.
+    """
+    if numba is None:
+        ufunc = np.vectorize(func, otypes=[np.int64])
+
+        @wraps(func)
+        def wrapper(*args):
+            # Les comparaisons avec NaN lèvent le drapeau FP « invalid » relu par NumPy
+            with np.errstate(invalid='ignore'):
+                return ufunc(*args)
+        return wrapper
+    return numba.vectorize(cache=True)(func)
+
+# Seuils des points du Nutri-Score (un point par seuil strictement dépassé)
+ENERGY_BINS = np.array([335, 670, 1005, 1340, 1675, 2010, 2345, 2680, 3015, 3350])
+SUGARS_BINS = np.array([4.5, 9, 13.5, 18, 22.5, 27, 31, 36, 40, 45])
+SATFAT_BINS = np.array([1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+SODIUM_BINS = np.array([90, 180, 270, 360, 450, 540, 630, 720, 810, 900])
+FIBER_BINS = np.array([0.7, 1.4, 2.1, 2.8, 3.5])
+PROT_BINS = np.array([1.6, 3.2, 4.8, 6.4, 8.0])
+
+# Colonnes nutritionnelles utilisées pour le Nutri-Score, dans l'ordre des
+# arguments de calculate_nutriscore_nutrigrade
+_NUTRI_COLS = ('energy_100g', 'saturated_fat_100g', 'sugars_100g',
+               'fiber_100g', 'proteins_100g', 'sodium_100g')
+
+# Bornes supérieures (incluses) des Nutri-Grades 'a' à 'd'
+GRADE_BINS = np.array([-1, 2, 10, 18])
+NUTRIGRADES = list('abcde')
+
+# Mêmes seuils en tuples de float pour le calcul scalaire : constantes pour numba,
+# et recherche dichotomique rapide en Python pur
+(_ENERGY_T, _SUGARS_T, _SATFAT_T, _SODIUM_T,
+ _FIBER_T, _PROT_T, _GRADE_T) = (tuple(bins.astype(float).tolist())
+                                 for bins in (ENERGY_BINS, SUGARS_BINS, SATFAT_BINS, SODIUM_BINS,
+                                              FIBER_BINS, PROT_BINS, GRADE_BINS))
+
+
+def _nan_rates_array(df: pd.DataFrame) -> np.ndarray:
+    """
+    Return the percentage of missing values in each column of a pandas DataFrame, as an ndarray.
+    A DataFrame without rows has an undefined (NaN) rate for every column.
+    """
+    if len(df) == 0:
+        return np.full(df.shape[1], np.nan)
+    return df.isna().to_numpy().mean(axis=0) * 100.0
+
+def _nan_rates(df: pd.DataFrame) -> pd.Series:
+    """
+    Return the percentage of missing values in each column of a pandas DataFrame.
+    """
+    return pd.Series(_nan_rates_array(df), index=df.columns)
+
+def nan_rate_by_columns(df: pd.DataFrame, as_percent_str: bool = False) -> pd.Series:
     """
     Calculate the nan rate for each column in a pandas DataFrame.
 
     Parameters:
     - df: pandas DataFrame
+    - as_percent_str: bool, format the rates as strings (default is False)
 
     Returns:
     - tx: pandas Series
-        A Series containing the nan rates for each column in the DataFrame.
-        The values are formatted as percentages (e.g., '10.00%').
+        A Series containing the nan rates (in %) for each column in the DataFrame.
+        If as_percent_str is True, the values are formatted as percentages (e.g., '10.00 %').
 
     Example:
     >>> nan_rates = nan_rate_by_columns(my_dataframe)
     >>> print(nan_rates)
-    column1    5.00%
-    column2    0.00%
-    column3   12.50%
-    dtype: object
+    column1     5.0
+    column2     0.0
+    column3    12.5
+    dtype: float64
+    >>> count_columns_by_nan_rate(nan_rates, threshold=10)
+    1
     """
     # Calculate nan rates for each column
-    nan_rates = df.isnull().sum(axis=0) / df.shape[0] * 100.00
+    tx = _nan_rates(df)
     
     # Format nan rates as percentages
-    tx = nan_rates.transform(lambda x: '{:02.2f}'.format(x)+' %')
+    if as_percent_str:
+        tx = tx.map('{:02.2f} %'.format)
     
     return tx
 
-def count_columns_by_nan_rate(df: pd.DataFrame, threshold: float = 50.0) -> int:
+def count_columns_by_nan_rate(df: Union[pd.DataFrame, pd.Series], threshold: float = 50.0) -> int:
     """
     Function returning the number of columns with nan rate above a given threshold.
     
     Parameters:
-    - df: pandas DataFrame
+    - df: pandas DataFrame, or the numeric Series returned by nan_rate_by_columns
+      (as_percent_str=False; the formatted strings raise a TypeError)
     - threshold: float, the nan rate threshold (default is 50)
     
     Returns:
     - count: int, the number of columns with nan rate above the threshold
     """
-    nan_rates = df.isnull().sum(axis=0) / df.shape[0] * 100.00
-    above_threshold = nan_rates[nan_rates > threshold]
-    count = above_threshold.shape[0]
+    if isinstance(df, pd.Series):
+        if not pd.api.types.is_numeric_dtype(df):
+            raise TypeError("Expected numeric nan rates: call nan_rate_by_columns "
+                            "with as_percent_str=False.")
+        nan_rates = df.to_numpy()
+    else:
+        nan_rates = _nan_rates_array(df)
+    count = int(np.count_nonzero(nan_rates > threshold))
     return count
 
+if numba is None:
+    # Sans numba, bisect (en C) compte directement les seuils inférieurs à la valeur ;
+    # un NaN n'est inférieur à aucun seuil et vaut donc 0
+    _bucket = bisect_left
+else:
+    @_njit
+    def _bucket(bins: tuple, value: float) -> int:
+        """
+        Number of thresholds in `bins` strictly exceeded by `value` (0 for NaN).
+        """
+        points = 0
+        for threshold in bins:
+            points += value > threshold
+        return points
+
+@_njit
+def _score_njit(energy_100g: float,
+    saturated_fat_100g: float,
+    sugars_100g: float,
+    fiber_100g: float,
+    proteins_100g: float,
+    sodium_100g: float
+) -> tuple:
+    """
+    Compiled core of calculate_nutriscore_nutrigrade.
+
+    Returns:
+    - tuple: The Nutri-Score and the index (0 to 4) of the Nutri-Grade in 'abcde'.
+    """
+    # Points pour les nutriments à limiter (points A) :
+    # un point par seuil strictement dépassé, sans branchement
+    points_limitants = (_bucket(_ENERGY_T, energy_100g) + _bucket(_SUGARS_T, sugars_100g)
+                        + _bucket(_SATFAT_T, saturated_fat_100g) + _bucket(_SODIUM_T, sodium_100g))
+
+    # Points pour les nutriments à favoriser (points C)
+    points_favorables = _bucket(_FIBER_T, fiber_100g) + _bucket(_PROT_T, proteins_100g)
+
+    # Calcul du Nutri-Score final
+    nutriscore = points_limitants - points_favorables
+
+    # Calcul du Nutri-Grade final (table des seuils)
+    grade_idx = _bucket(_GRADE_T, nutriscore)
+
+    return nutriscore, grade_idx
+
+
+@_vectorize
+def _score_njit_vec(energy_100g, saturated_fat_100g, sugars_100g, fiber_100g, proteins_100g, sodium_100g):
+    """
+    Element-wise Nutri-Score over NumPy columns (ufunc when numba is available).
+    """
+    return _score_njit(energy_100g, saturated_fat_100g, sugars_100g,
+                       fiber_100g, proteins_100g, sodium_100g)[0]
+
+
 def calculate_nutriscore_nutrigrade(energy_100g: float,
     saturated_fat_100g: float,
     sugars_100g: float,
@@ -86,185 +223,257 @@ def calculate_nutriscore_nutrigrade(energy_100g: float,
     - 'd': 10 < Nutri-Score <= 18
     - 'e': Nutri-Score > 18
     """
-    
-    
+    nutriscore, grade_idx = _score_njit(energy_100g, saturated_fat_100g, sugars_100g,
+                                        fiber_100g, proteins_100g, sodium_100g)
+    return [int(nutriscore), NUTRIGRADES[grade_idx]]
+
+
+def _points(bins: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """
+    Count, for each value, the number of thresholds in `bins` it strictly exceeds.
+    Missing values score 0 point, as in calculate_nutriscore_nutrigrade.
+    """
+    values = np.nan_to_num(np.asarray(values, dtype=float), nan=0.0)
+    return np.searchsorted(bins, values, side='left')
+
+def _score_vec(energy: np.ndarray,
+    sat_fat: np.ndarray,
+    sugars: np.ndarray,
+    fiber: np.ndarray,
+    proteins: np.ndarray,
+    sodium: np.ndarray
+) -> np.ndarray:
+    """
+    Nutri-Scores (int) of whole columns, computed with NumPy only.
+    """
     # Points pour les nutriments à limiter (points A)
-    points_limitants = 0
-
-    if energy_100g <= 335:
-        points_limitants += 0
-    elif 335 < energy_100g <= 670:
-        points_limitants += 1
-    elif 670 < energy_100g <= 1005:
-        points_limitants += 2
-    elif 1005 < energy_100g <= 1340:
-        points_limitants += 3
-    elif 1340 < energy_100g <= 1675:
-        points_limitants += 4
-    elif 1675 < energy_100g <= 2010:
-        points_limitants += 5
-    elif 2010 < energy_100g <= 2345:
-        points_limitants += 6
-    elif 2345 < energy_100g <= 2680:
-        points_limitants += 7
-    elif 2680 < energy_100g <= 3015:
-        points_limitants += 8
-    elif 3015 < energy_100g <= 3350:
-        points_limitants += 9
-    elif energy_100g > 3350:
-        points_limitants += 10
-
-    if sugars_100g <= 4.5:
-        points_limitants += 0
-    elif 4.5 < sugars_100g <= 9:
-        points_limitants += 1
-    elif 9 < sugars_100g <= 13.5:
-        points_limitants += 2
-    elif 13.5 < sugars_100g <= 18:
-        points_limitants += 3
-    elif 18 < sugars_100g <= 22.5:
-        points_limitants += 4
-    elif 22.5 < sugars_100g <= 27:
-        points_limitants += 5
-    elif 27 < sugars_100g <= 31:
-        points_limitants += 6
-    elif 31 < sugars_100g <= 36:
-        points_limitants += 7
-    elif 36 < sugars_100g <= 40:
-        points_limitants += 8
-    elif 40 < sugars_100g <= 45:
-        points_limitants += 9
-    elif sugars_100g > 45:
-        points_limitants += 10
-
-    if saturated_fat_100g <= 1:
-        points_limitants += 0
-    elif 1 < saturated_fat_100g <= 2:
-        points_limitants += 1
-    elif 2 < saturated_fat_100g <= 3:
-        points_limitants += 2
-    elif 3 < saturated_fat_100g <= 4:
-        points_limitants += 3
-    elif 4 < saturated_fat_100g <= 5:
-        points_limitants += 4
-    elif 5 < saturated_fat_100g <= 6:
-        points_limitants += 5
-    elif 6 < saturated_fat_100g <= 7:
-        points_limitants += 6
-    elif 7 < saturated_fat_100g <= 8:
-        points_limitants += 7
-    elif 8 < saturated_fat_100g <= 9:
-        points_limitants += 8
-    elif 9 < saturated_fat_100g <= 10:
-        points_limitants += 9
-    elif saturated_fat_100g > 10:
-        points_limitants += 10
-
-    if sodium_100g <= 90:
-        points_limitants += 0
-    elif 90 < sodium_100g <= 180:
-        points_limitants += 1
-    elif 180 < sodium_100g <= 270:
-        points_limitants += 2
-    elif 270 < sodium_100g <= 360:
-        points_limitants += 3
-    elif 360 < sodium_100g <= 450:
-        points_limitants += 4
-    elif 450 < sodium_100g <= 540:
-        points_limitants += 5
-    elif 540 < sodium_100g <= 630:
-        points_limitants += 6
-    elif 630 < sodium_100g <= 720:
-        points_limitants += 7
-    elif 720 < sodium_100g <= 810:
-        points_limitants += 8
-    elif 810 < sodium_100g <= 900:
-        points_limitants += 9
-    elif sodium_100g > 900:
-        points_limitants += 10
+    points_limitants = (_points(ENERGY_BINS, energy)
+                        + _points(SUGARS_BINS, sugars)
+                        + _points(SATFAT_BINS, sat_fat)
+                        + _points(SODIUM_BINS, sodium))
 
-    
     # Points pour les nutriments à favoriser (points C)
-    points_favorables = 0
-
-    if fiber_100g <= 0.7:
-        points_favorables += 0
-    elif 0.7 <= fiber_100g <= 1.4:
-        points_favorables += 1
-    elif 1.4 <= fiber_100g <= 2.1:
-        points_favorables += 2
-    elif 2.1 <= fiber_100g <= 2.8:
-        points_favorables += 3
-    elif 2.8 <= fiber_100g <= 3.5:
-        points_favorables += 4
-    elif fiber_100g > 3.5:
-        points_favorables += 5
-    
-    if proteins_100g <= 1.6:
-        points_favorables += 0
-    elif 1.6 <= proteins_100g <= 3.2:
-        points_favorables += 1
-    elif 3.2 <= proteins_100g <= 4.8:
-        points_favorables += 2
-    elif 4.8 <= proteins_100g <= 6.4:
-        points_favorables += 3
-    elif 6.4 <= proteins_100g <= 8.0:
-        points_favorables += 4
-    elif proteins_100g > 8.0:
-        points_favorables += 5
-    
-    # Calcul du Nutri-Score final
-    nutriscore = points_limitants - points_favorables
-    
-    # Calcul du Nutri-Grade final
-    if nutriscore <= -1:
-        nutrigrade = 'a'
-    elif -1<nutriscore<=2:
-        nutrigrade = 'b'
-    elif 2<nutriscore<=10:
-        nutrigrade = 'c'
-    elif 10<nutriscore<=18:
-        nutrigrade = 'd'
-    elif 18<nutriscore:
-        nutrigrade = 'e'
-    else:
-        print('There was an error during the nutriscore calculation.')
-    
-    return [nutriscore, nutrigrade]
+    points_favorables = _points(FIBER_BINS, fiber) + _points(PROT_BINS, proteins)
 
+    return points_limitants - points_favorables
 
-def fill_missing_nutriscore(row: pd.Series) -> float:
+def nutriscore_vec(energy: np.ndarray,
+    sat_fat: np.ndarray,
+    sugars: np.ndarray,
+    fiber: np.ndarray,
+    proteins: np.ndarray,
+    sodium: np.ndarray
+) -> tuple:
     """
-    Fill missing values in the 'nutrition_score_fr_100g' column using the given nutritional values.
+    Vectorized version of calculate_nutriscore_nutrigrade working on whole columns.
 
     Parameters:
-    - row (pd.Series): A row from a DataFrame containing nutritional information.
+    - energy, sat_fat, sugars, fiber, proteins, sodium (array-like):
+      Nutritional values per 100g, all of the same length.
 
     Returns:
-    - float: The calculated Nutri-Score.
+    - tuple: (score, grade) NumPy arrays holding the Nutri-Scores (int)
+      and the Nutri-Grades ('a' to 'e').
+    """
+    score = _score_vec(energy, sat_fat, sugars, fiber, proteins, sodium)
+    grade = np.asarray(NUTRIGRADES)[np.searchsorted(GRADE_BINS, score, side='left')]
+
+    return score, grade
+
+@_njit(parallel=True)
+def nutri_kernel(energy: np.ndarray,
+    sat_fat: np.ndarray,
+    sugars: np.ndarray,
+    fiber: np.ndarray,
+    proteins: np.ndarray,
+    sodium: np.ndarray,
+    score: np.ndarray,
+    grade: np.ndarray
+) -> None:
     """
-    if np.isnan(row['nutrition_score_fr_100g']):
-        columns = ['energy_100g', 'saturated_fat_100g', 'sugars_100g', 'fiber_100g', 'proteins_100g', 'sodium_100g']
-        values = row[columns].values
-        energy_100g, saturated_fat_100g, sugars_100g, fiber_100g, proteins_100g, sodium_100g = values.flatten().tolist()
-        return calculate_nutriscore_nutrigrade(energy_100g, saturated_fat_100g, sugars_100g, fiber_100g, proteins_100g, sodium_100g)[0]
+    Compute the Nutri-Score of each row into `score` and the index of its
+    Nutri-Grade in 'abcde' into `grade`. Rows are processed in parallel by numba.
+
+    Parameters:
+    - energy, sat_fat, sugars, fiber, proteins, sodium (np.ndarray):
+      float64 nutritional values per 100g, all of the same length.
+    - score (np.ndarray): int64 output array.
+    - grade (np.ndarray): uint8 output array.
+    """
+    for i in _prange(energy.shape[0]):
+        s, g = _score_njit(energy[i], sat_fat[i], sugars[i], fiber[i], proteins[i], sodium[i])
+        score[i] = s
+        grade[i] = g
+
+def _nutri_codes(df: pd.DataFrame) -> tuple:
+    """
+    Return the Nutri-Scores and the Nutri-Grade codes (0 for 'a' to 4 for 'e')
+    of every row of `df`, with nutri_kernel when numba is installed.
+    """
+    columns = [np.ascontiguousarray(df[col].to_numpy(dtype=np.float64)) for col in _NUTRI_COLS]
+    if numba is None:
+        score = _score_vec(*columns)
+        grade = np.searchsorted(GRADE_BINS, score, side='left').astype(np.uint8)
     else:
-        return row['nutrition_score_fr_100g']
+        score = np.empty(len(df), dtype=np.int64)
+        grade = np.empty(len(df), dtype=np.uint8)
+        nutri_kernel(*columns, score, grade)
+    return score, grade
+
+def _grade_codes(scores: np.ndarray) -> np.ndarray:
+    """
+    Return the Nutri-Grade codes (0 for 'a' to 4 for 'e', -1 for a missing score) of `scores`.
+    """
+    grades = pd.cut(scores, bins=np.r_[-np.inf, GRADE_BINS, np.inf],
+                    labels=NUTRIGRADES, right=True, ordered=True)
+    return np.asarray(grades.codes)
+
+def _grade_categorical(values) -> pd.Categorical:
+    """
+    Ordered categorical over 'abcde' ('a' < ... < 'e'). Labels outside 'abcde'
+    are kept as extra categories, ranked after 'e' in order of appearance.
+    """
+    values = pd.Series(values)
+    labels = values.dropna().unique()
+    extras = [label for label in labels if label not in NUTRIGRADES]
+    return pd.Categorical(values, categories=NUTRIGRADES + extras, ordered=True)
+
+def _fill_nutrigrade_from_score(df: pd.DataFrame, computed: Optional[np.ndarray] = None) -> None:
+    """
+    Fill missing values in the 'nutrition_grade_fr' column in place, and convert
+    it to an ordered categorical. `computed` optionally holds grade codes already
+    known for some rows (-1 elsewhere); the other missing grades are deduced from
+    the 'nutrition_score_fr_100g' column. Existing grades are left untouched.
+    """
+    grades = _grade_categorical(df['nutrition_grade_fr'])
+    grade_codes = grades.codes.copy()
+    if computed is not None:
+        mask_g = grade_codes == -1
+        grade_codes[mask_g] = computed[mask_g]
+
+    # Le Nutri-Grade ne dépend que du Nutri-Score
+    rest = grade_codes == -1
+    scores = df['nutrition_score_fr_100g'].to_numpy(dtype=np.float64)
+    grade_codes[rest] = _grade_codes(scores[rest])
+
+    df['nutrition_grade_fr'] = pd.Categorical.from_codes(grade_codes, categories=grades.categories,
+                                                         ordered=True)
+
+def fill_nutri_columns(df: pd.DataFrame) -> None:
+    """
+    Fill missing values in the 'nutrition_score_fr_100g' and 'nutrition_grade_fr'
+    columns in place, using the nutritional values of each row.
+    'nutrition_grade_fr' is converted to an ordered categorical ('a' < ... < 'e');
+    only missing grades are filled, labels outside 'abcde' are kept as extra categories.
+
+    Parameters:
+    - df (pd.DataFrame): A DataFrame containing nutritional information.
+    """
+    mask_s = df['nutrition_score_fr_100g'].isna().to_numpy()
+
+    # Lignes sans Nutri-Score : score et grade calculés en une seule passe
+    score, codes = _nutri_codes(df.loc[mask_s])
+    score_arr = df['nutrition_score_fr_100g'].to_numpy(dtype=np.float64, copy=True)
+    score_arr[mask_s] = score
+    df['nutrition_score_fr_100g'] = score_arr
 
-def fill_missing_nutrigrade(row: pd.Series) -> str:
+    computed = np.full(len(df), -1, dtype=np.int8)
+    computed[mask_s] = codes
+    _fill_nutrigrade_from_score(df, computed)
+
+@_njit
+def _fill_score_njit(row: np.ndarray) -> int:
+    """
+    Nutri-Score of a raw row whose values are ordered as
+    energy, saturated fat, sugars, fiber, proteins, sodium (per 100g).
+    """
+    return _score_njit(row[0], row[1], row[2], row[3], row[4], row[5])[0]
+
+def fill_nutri_columns_apply(df: pd.DataFrame) -> None:
     """
-    Fill missing values in the 'nutrition_grade_fr' column using the given nutritional values.
+    Row-wise variant of fill_nutri_columns, for code relying on DataFrame.apply.
+    Rows are passed as NumPy arrays (raw=True) to a numba-compiled function
+    when numba is installed (engine='numba'), and to the plain Python one otherwise.
+    Existing grades, including labels outside 'abcde', are kept as in fill_nutri_columns.
 
     Parameters:
-    - row (pd.Series): A row from a DataFrame containing nutritional information.
+    - df (pd.DataFrame): A DataFrame containing nutritional information.
+    """
+    mask_s = df['nutrition_score_fr_100g'].isna()
+
+    if mask_s.any():
+        # _NUTRI_COLS est dans l'ordre attendu par _fill_score_njit
+        sub = df.loc[mask_s, list(_NUTRI_COLS)].astype(np.float64)
+        engine = 'python' if numba is None else 'numba'
+        df.loc[mask_s, 'nutrition_score_fr_100g'] = sub.apply(_fill_score_njit, axis=1,
+                                                              raw=True, engine=engine)
+
+    _fill_nutrigrade_from_score(df)
+
+
+def _import_polars():
+    """
+    Import polars on demand: it is optional and only the *_pl functions need it.
+    """
+    try:
+        import polars
+    except ImportError:
+        raise ImportError("The *_pl functions require polars (pip install polars).") from None
+    return polars
+
+def _points_pl(column: str, bins: np.ndarray) -> "pl.Expr":
+    """
+    Polars expression counting the thresholds in `bins` strictly exceeded by `column`.
+    Missing values (null or NaN) score 0 point.
+    """
+    pl = _import_polars()
+    values = pl.col(column).cast(pl.Float64).fill_nan(None)
+    exceeded = [values > pl.lit(threshold, dtype=pl.Float64) for threshold in bins.tolist()]
+    return pl.sum_horizontal(exceeded).cast(pl.Int16)
+
+def nutri_fill_pl(df: "pl.DataFrame") -> "pl.DataFrame":
+    """
+    Polars version of fill_nutri_columns: fill missing values in the
+    'nutrition_score_fr_100g' and 'nutrition_grade_fr' columns.
+
+    Parameters:
+    - df (pl.DataFrame): A DataFrame containing nutritional information.
 
     Returns:
-    - str: The calculated Nutri-Grade.
+    - pl.DataFrame: A new DataFrame with both columns filled.
     """
-    if pd.isnull(row['nutrition_grade_fr']):
-        columns = ['energy_100g', 'saturated_fat_100g', 'sugars_100g', 'fiber_100g', 'proteins_100g', 'sodium_100g']
-        values = row[columns].values
-        energy_100g, saturated_fat_100g, sugars_100g, fiber_100g, proteins_100g, sodium_100g = values.flatten().tolist()
-        return calculate_nutriscore_nutrigrade(energy_100g, saturated_fat_100g, sugars_100g, fiber_100g, proteins_100g, sodium_100g)[1]
-    else:
-        return row['nutrition_grade_fr']
+    pl = _import_polars()
+
+    # Points A moins points C, en une seule expression
+    score = (_points_pl('energy_100g', ENERGY_BINS)
+             + _points_pl('sugars_100g', SUGARS_BINS)
+             + _points_pl('saturated_fat_100g', SATFAT_BINS)
+             + _points_pl('sodium_100g', SODIUM_BINS)
+             - _points_pl('fiber_100g', FIBER_BINS)
+             - _points_pl('proteins_100g', PROT_BINS))
+
+    score_col = pl.col('nutrition_score_fr_100g')
+    grade_idx = pl.sum_horizontal([score_col > threshold for threshold in GRADE_BINS.tolist()])
+    grade = grade_idx.replace_strict(dict(enumerate(NUTRIGRADES)), return_dtype=pl.String)
+
+    return (df.lazy()
+              .with_columns(score_col.cast(pl.Float64).fill_nan(None).fill_null(score.cast(pl.Float64)))
+              .with_columns(pl.col('nutrition_grade_fr').cast(pl.String).fill_null(grade))
+              .collect())
+
+def fill_nutri_columns_pl(df: pd.DataFrame) -> None:
+    """
+    Drop-in replacement for fill_nutri_columns running the computation with polars
+    (the pandas <-> polars conversion also requires pyarrow). Existing grades,
+    including labels outside 'abcde', are kept as in fill_nutri_columns.
+
+    Parameters:
+    - df (pd.DataFrame): A DataFrame containing nutritional information.
+    """
+    pl = _import_polars()
+
+    columns = list(_NUTRI_COLS) + ['nutrition_score_fr_100g', 'nutrition_grade_fr']
+    filled = nutri_fill_pl(pl.from_pandas(df[columns])).to_pandas()
+
+    df['nutrition_score_fr_100g'] = filled['nutrition_score_fr_100g'].to_numpy()
+    df['nutrition_grade_fr'] = _grade_categorical(filled['nutrition_grade_fr'].to_numpy())